@@ -20,6 +20,7 @@
 #ifndef EMP_EVO_STATE_GRID_H
 #define EMP_EVO_STATE_GRID_H
 
+#include <array>
 #include <map>
 #include <string>
 
@@ -61,11 +62,11 @@ namespace emp {
     emp::vector<StateInfo> states;           ///< All available states.  Position is key ID
 
     std::map<int, size_t> state_map;         ///< Map of state_id to key ID (state_id can be < 0)
-    std::map<char, size_t> symbol_map;       ///< Map of symbols to associated key ID
+    std::array<size_t, 256> symbol_map;      ///< Lookup table of symbols to key ID (default 0)
     std::map<std::string, size_t> name_map;  ///< Map of names to associated key ID
 
     size_t GetKey(int state_id) const { return Find(state_map, state_id, 0); }
-    size_t GetKey(char symbol) const { return Find(symbol_map, symbol, 0); }
+    size_t GetKey(char symbol) const { return symbol_map[(unsigned char) symbol]; }
     size_t GetKey(const std::string & name) const { return Find(name_map, name, 0); }
   public:
     StateGridInfo() : states(), state_map(), symbol_map(), name_map() { ; }
@@ -95,7 +96,7 @@ namespace emp {
       size_t key_id = states.size();
       states.emplace_back(id, symbol, mult, name, desc);
       state_map[id] = key_id;
-      symbol_map[symbol] = key_id;
+      symbol_map[(unsigned char) symbol] = key_id;
       name_map[name] = key_id;
     }
 
@@ -295,10 +296,14 @@ namespace emp {
     }
 
     /// Get a BitVector indicating the full history of which positions this organism has traversed.
+    /// History entries that fall outside of the provided grid are ignored.
     emp::BitVector GetVisited(const StateGrid & grid) const {
       emp::BitVector at_array(grid.GetSize());
+      const size_t width = grid.GetWidth();
+      const size_t height = grid.GetHeight();
       for (const State & state : history) {
-        size_t pos = state.x + grid.GetWidth() * state.y;
+        if (state.x >= width || state.y >= height) continue;  // Off this grid.
+        size_t pos = state.x + width * state.y;
         at_array.Set(pos);
       }
       return at_array;
@@ -334,15 +339,13 @@ namespace emp {
       // std::cout << "steps = " << steps
       //           << "  facing = " << cur_state.facing
       //           << "  start = (" << cur_state.x << "," << cur_state.y << ")";
-      switch (cur_state.facing) {
-        case 0: MoveX(grid, -steps); MoveY(grid, -steps); break;
-        case 1:                      MoveY(grid, -steps); break;
-        case 2: MoveX(grid, +steps); MoveY(grid, -steps); break;
-        case 3: MoveX(grid, +steps);                      break;
-        case 4: MoveX(grid, +steps); MoveY(grid, +steps); break;
-        case 5:                      MoveY(grid, +steps); break;
-        case 6: MoveX(grid, -steps); MoveY(grid, +steps); break;
-        case 7: MoveX(grid, -steps);                      break;
+      // Offsets for each facing: UL, Up, UR, Right, DR, Down, DL, Left
+      static constexpr int dir_x[8] = { -1,  0, +1, +1, +1,  0, -1, -1 };
+      static constexpr int dir_y[8] = { -1, -1, -1,  0, +1, +1, +1,  0 };
+      emp_assert(cur_state.facing >= 0 && cur_state.facing < 8);
+      if ((unsigned int) cur_state.facing < 8) {  // Invalid facings do not move.
+        MoveX(grid, dir_x[cur_state.facing] * steps);
+        MoveY(grid, dir_y[cur_state.facing] * steps);
       }
       UpdateHistory();
       // std::cout << " end = (" << cur_state.x << "," << cur_state.y << ")"
@@ -377,11 +380,12 @@ namespace emp {
       emp_assert(history.size(), "You can only print history of a StateGrid if you track it!");
       const size_t width = grid.GetWidth();
       const size_t height = grid.GetHeight();
+      const emp::BitVector visited = GetVisited(grid);  // Scan history once, not per cell.
       std::string out(width*2-1, ' ');
       for (size_t i = 0; i < height; i++) {
         for (size_t j = 1; j < width; j++) {
           out[j*2] = grid.GetSymbol(j,i);
-          if (WasAt(j,i)) out[j*2] = '*';
+          if (visited.Get(i*width+j)) out[j*2] = '*';
         }
         os << out << std::endl;
       }